@@ -5,10 +5,12 @@ Built by Per Ram Paragi | Director, Accreditation & Strategic Planning
 """
 
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
+import copy
+from types import SimpleNamespace
 from datetime import datetime
 
 # ─────────────────────────────────────────────
@@ -21,24 +23,28 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
+# Serialize figures for the browser with the C-backed orjson encoder
+pio.json.config.default_engine = "orjson"
+
 # Executive color palette — muted, professional
-COLORS = {
-    "primary": "#1B2A4A",      # deep navy
-    "accent": "#2E86AB",       # steel blue
-    "success": "#2D936C",      # muted green
-    "warning": "#D4A843",      # muted gold
-    "danger": "#C44536",       # muted red
-    "light_bg": "#F8F9FA",     # near-white
-    "text": "#333333",         # dark gray
-    "muted": "#8C8C8C",        # medium gray
-    "card_border": "#E8ECF0",  # light border
-}
-
-st.markdown(f"""
+COLORS = SimpleNamespace(
+    primary="#1B2A4A",      # deep navy
+    accent="#2E86AB",       # steel blue
+    success="#2D936C",      # muted green
+    warning="#D4A843",      # muted gold
+    danger="#C44536",       # muted red
+    light_bg="#F8F9FA",     # near-white
+    text="#333333",         # dark gray
+    muted="#8C8C8C",        # medium gray
+    card_border="#E8ECF0",  # light border
+)
+
+# Interpolated with the palette inside the cached _inject_css() below
+_CSS_TEMPLATE = """
 <style>
     /* Global */
     .stApp {{
-        background-color: {COLORS['light_bg']};
+        background-color: {colors.light_bg};
     }}
     
     /* Remove default padding */
@@ -50,7 +56,7 @@ st.markdown(f"""
     
     /* Header */
     .dashboard-header {{
-        background: linear-gradient(135deg, {COLORS['primary']} 0%, #2A3F6B 100%);
+        background: linear-gradient(135deg, {colors.primary} 0%, #2A3F6B 100%);
         color: white;
         padding: 1.8rem 2.2rem;
         border-radius: 12px;
@@ -71,7 +77,7 @@ st.markdown(f"""
     /* KPI Cards */
     .kpi-card {{
         background: white;
-        border: 1px solid {COLORS['card_border']};
+        border: 1px solid {colors.card_border};
         border-radius: 10px;
         padding: 1.4rem 1.6rem;
         text-align: left;
@@ -83,37 +89,41 @@ st.markdown(f"""
         font-weight: 600;
         text-transform: uppercase;
         letter-spacing: 0.06em;
-        color: {COLORS['muted']};
+        color: {colors.muted};
         margin-bottom: 0.4rem;
     }}
     .kpi-value {{
         font-size: 2.2rem;
         font-weight: 700;
-        color: {COLORS['primary']};
+        color: {colors.primary};
         line-height: 1.1;
         margin-bottom: 0.3rem;
     }}
+    .kpi-row {{
+        display: grid;
+        gap: 1rem;
+    }}
     .kpi-delta {{
         font-size: 0.8rem;
         font-weight: 500;
     }}
-    .kpi-delta.positive {{ color: {COLORS['success']}; }}
-    .kpi-delta.negative {{ color: {COLORS['danger']}; }}
-    .kpi-delta.neutral {{ color: {COLORS['muted']}; }}
+    .kpi-delta.positive {{ color: {colors.success}; }}
+    .kpi-delta.negative {{ color: {colors.danger}; }}
+    .kpi-delta.neutral {{ color: {colors.muted}; }}
     
     /* Section headers */
     .section-header {{
         font-size: 1.05rem;
         font-weight: 600;
-        color: {COLORS['primary']};
+        color: {colors.primary};
         margin: 1.6rem 0 0.3rem 0;
         padding-bottom: 0.4rem;
-        border-bottom: 2px solid {COLORS['accent']};
+        border-bottom: 2px solid {colors.accent};
         display: inline-block;
     }}
     .section-caption {{
         font-size: 0.8rem;
-        color: {COLORS['muted']};
+        color: {colors.muted};
         margin-bottom: 1rem;
         font-style: italic;
     }}
@@ -121,7 +131,7 @@ st.markdown(f"""
     /* Chart containers */
     .chart-card {{
         background: white;
-        border: 1px solid {COLORS['card_border']};
+        border: 1px solid {colors.card_border};
         border-radius: 10px;
         padding: 1.4rem;
         box-shadow: 0 1px 3px rgba(0,0,0,0.04);
@@ -130,12 +140,12 @@ st.markdown(f"""
     .chart-title {{
         font-size: 0.9rem;
         font-weight: 600;
-        color: {COLORS['primary']};
+        color: {colors.primary};
         margin-bottom: 0.2rem;
     }}
     .chart-insight {{
         font-size: 0.78rem;
-        color: {COLORS['muted']};
+        color: {colors.muted};
         margin-bottom: 0.8rem;
         line-height: 1.4;
     }}
@@ -143,12 +153,12 @@ st.markdown(f"""
     /* Narrative box */
     .narrative-box {{
         background: white;
-        border-left: 4px solid {COLORS['accent']};
+        border-left: 4px solid {colors.accent};
         border-radius: 0 8px 8px 0;
         padding: 1rem 1.4rem;
         margin: 0.8rem 0;
         font-size: 0.85rem;
-        color: {COLORS['text']};
+        color: {colors.text};
         line-height: 1.6;
     }}
     
@@ -156,10 +166,10 @@ st.markdown(f"""
     .dashboard-footer {{
         text-align: center;
         font-size: 0.72rem;
-        color: {COLORS['muted']};
+        color: {colors.muted};
         margin-top: 2rem;
         padding-top: 1rem;
-        border-top: 1px solid {COLORS['card_border']};
+        border-top: 1px solid {colors.card_border};
     }}
     
     /* Hide Streamlit extras */
@@ -177,53 +187,104 @@ st.markdown(f"""
         padding: 0.5rem 1rem;
     }}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _inject_css():
+    st.markdown(_CSS_TEMPLATE.format(colors=COLORS), unsafe_allow_html=True)
+
+_inject_css()
 
 
 # ─────────────────────────────────────────────
 # SYNTHETIC DATA ENGINE
 # ─────────────────────────────────────────────
-np.random.seed(42)
-
-ACADEMIC_YEARS = ["2019-20", "2020-21", "2021-22", "2022-23", "2023-24", "2024-25"]
-DEPARTMENTS = [
+ACADEMIC_YEARS = ("2019-20", "2020-21", "2021-22", "2022-23", "2023-24", "2024-25")
+DEPARTMENTS = (
     "Internal Medicine", "Surgery", "Pediatrics", "OB-GYN",
-    "Psychiatry", "Family Medicine", "Neurology", "Emergency Medicine"
-]
+    "Psychiatry", "Family Medicine", "Neurology", "Emergency Medicine",
+)
+
+def format_delta(delta, fmt, prefix="", suffix=""):
+    # KPI text and direction for a year-over-year change
+    sign = "+" if delta >= 0 else "−"
+    direction = "positive" if delta > 0 else "negative" if delta < 0 else "neutral"
+    return f"{sign}{prefix}{abs(delta):{fmt}}{suffix}", direction
 
+@st.cache_data(ttl=None)
 def generate_education_data():
-    return {
-        "enrollment": [192, 195, 198, 200, 205, 210],
-        "step1_pass": [96.2, 97.1, 95.8, 97.5, 98.1, 97.8],
-        "step2_pass": [97.8, 98.2, 97.5, 98.6, 99.0, 98.4],
-        "match_rate": [93.5, 94.2, 91.8, 95.1, 96.3, 95.8],
-        "top_choice_match": [62.1, 64.5, 58.3, 66.2, 68.1, 67.5],
-        "attrition_rate": [3.2, 2.8, 3.5, 2.1, 1.9, 2.2],
-        "msq_overall_satisfaction": [3.72, 3.68, 3.55, 3.81, 3.89, 3.92],
-        "gq_satisfaction": [78.5, 80.2, 76.1, 82.4, 84.1, 85.3],
+    # One row per metric, one column per academic year
+    metric_names = (
+        "enrollment", "step1_pass", "step2_pass", "match_rate", "top_choice_match",
+        "attrition_rate", "msq_overall_satisfaction", "gq_satisfaction",
+    )
+    trends = np.array([
+        [192, 195, 198, 200, 205, 210],
+        [96.2, 97.1, 95.8, 97.5, 98.1, 97.8],
+        [97.8, 98.2, 97.5, 98.6, 99.0, 98.4],
+        [93.5, 94.2, 91.8, 95.1, 96.3, 95.8],
+        [62.1, 64.5, 58.3, 66.2, 68.1, 67.5],
+        [3.2, 2.8, 3.5, 2.1, 1.9, 2.2],
+        [3.72, 3.68, 3.55, 3.81, 3.89, 3.92],
+        [78.5, 80.2, 76.1, 82.4, 84.1, 85.3],
+    ])
+    yoy = trends[:, -1] - trends[:, -2]
+    enrollment_delta = format_delta(yoy[metric_names.index("enrollment")], ".0f",
+                                    suffix=" vs. prior year")
+    match_delta = format_delta(yoy[metric_names.index("match_rate")], ".1f",
+                               suffix="pp vs. prior year")
+    kpis = {
+        "enrollment_delta_str": enrollment_delta[0],
+        "enrollment_delta_dir": enrollment_delta[1],
+        "match_rate_delta_str": match_delta[0],
+        "match_rate_delta_dir": match_delta[1],
     }
+    return metric_names, trends, kpis
 
+@st.cache_data(ttl=None)
 def generate_research_data():
+    total_funding = np.asarray([148.2, 155.6, 162.1, 171.8, 185.3, 192.7])
+    funding_delta = format_delta(total_funding[-1] - total_funding[-2], ".1f",
+                                 prefix="$", suffix="M vs. prior year")
     return {
-        "total_funding_m": [148.2, 155.6, 162.1, 171.8, 185.3, 192.7],
-        "nih_funding_m": [98.5, 103.2, 108.7, 115.4, 124.1, 128.9],
+        "total_funding_m": total_funding,
+        "nih_funding_m": np.asarray([98.5, 103.2, 108.7, 115.4, 124.1, 128.9]),
         "faculty_pubs": [1842, 1923, 2015, 2187, 2341, 2456],
         "h_index_median": [18, 19, 19, 20, 21, 22],
         "clinical_trials": [245, 262, 278, 301, 324, 338],
+        "total_funding_delta_str": funding_delta[0],
+        "total_funding_delta_dir": funding_delta[1],
     }
 
+@st.cache_data(ttl=None)
 def generate_workforce_data():
+    # Local seeded state keeps the cached result independent of global RNG order
+    rng = np.random.default_rng(42)
+    scores = np.round(3.2 + rng.uniform(0, 1.2, size=len(DEPARTMENTS)), 2)
+    dept_satisfaction = dict(zip(DEPARTMENTS, scores.tolist()))
+    # Pre-sorted by score (ascending) for the department bar chart
+    pairs = sorted(dept_satisfaction.items(), key=lambda x: x[1])
+    depts_sorted, scores_sorted = zip(*pairs)
+    total_faculty = [685, 698, 712, 725, 741, 758]
+    faculty_delta = format_delta(total_faculty[-1] - total_faculty[-2], "d", suffix=" net new")
     return {
-        "total_faculty": [685, 698, 712, 725, 741, 758],
+        "total_faculty": total_faculty,
         "pct_female_faculty": [38.2, 39.1, 40.5, 41.8, 43.2, 44.1],
         "pct_urm_faculty": [12.5, 13.1, 13.8, 14.5, 15.2, 15.8],
         "voluntary_turnover": [8.2, 7.8, 9.1, 7.5, 6.9, 7.1],
         "time_to_promotion_yr": [6.8, 6.5, 6.7, 6.3, 6.1, 5.9],
-        "dept_satisfaction": {
-            dept: round(3.2 + np.random.uniform(0, 1.2), 2) for dept in DEPARTMENTS
-        },
+        "dept_satisfaction": dept_satisfaction,
+        "depts_sorted": depts_sorted,
+        "scores_sorted": scores_sorted,
+        "dept_colors": tuple(
+            COLORS.danger if s < 3.5 else COLORS.accent for s in scores_sorted
+        ),
+        "dept_labels": tuple(f"{s:.1f}" for s in scores_sorted),
+        "total_faculty_delta_str": faculty_delta[0],
+        "total_faculty_delta_dir": faculty_delta[1],
     }
 
+@st.cache_data(ttl=None)
 def generate_compliance_data():
     return {
         "lcme_standards_met": 93,
@@ -236,11 +297,24 @@ def generate_compliance_data():
         "compliance_training_pct": 94.8,
     }
 
-ed_data = generate_education_data()
+@st.cache_data(ttl=None)
+def _build_accred_matrix():
+    rng = np.random.default_rng(42)
+    r = rng.random((8, 12))
+    z = np.where(r < 0.03, 0, np.where(r < 0.08, 1, 2)).astype(np.int8)
+    # Status codes (int8) index straight into the label table
+    status_labels = np.asarray(("Needs Attention", "In Progress", "Met"), dtype=object)
+    labels = status_labels[z]
+    return z, labels
+
+ed_metrics, ed_trends, ed_kpis = generate_education_data()
 res_data = generate_research_data()
 wf_data = generate_workforce_data()
 comp_data = generate_compliance_data()
 
+def ed(name):
+    return tuple(ed_trends[ed_metrics.index(name)].tolist())
+
 
 # ─────────────────────────────────────────────
 # HELPER FUNCTIONS
@@ -250,15 +324,56 @@ def kpi_card(label, value, delta=None, delta_dir="positive", prefix="", suffix="
     if delta is not None:
         arrow = "▲" if delta_dir == "positive" else "▼" if delta_dir == "negative" else "●"
         delta_html = f'<div class="kpi-delta {delta_dir}">{arrow} {delta}</div>'
+    # Kept on one line so several cards can share a markdown block without
+    # blank lines ending the HTML early
+    return (f'<div class="kpi-card"><div class="kpi-label">{label}</div>'
+            f'<div class="kpi-value">{prefix}{value}{suffix}</div>{delta_html}</div>')
+
+def kpi_row(*cards):
+    return (f'<div class="kpi-row" style="grid-template-columns: repeat({len(cards)}, 1fr);">'
+            f'{"".join(cards)}</div>')
+
+def chart_card(title, insight):
     return f"""
-    <div class="kpi-card">
-        <div class="kpi-label">{label}</div>
-        <div class="kpi-value">{prefix}{value}{suffix}</div>
-        {delta_html}
+    <div class="chart-card">
+        <div class="chart-title">{title}</div>
+        <div class="chart-insight">{insight}</div>
     </div>
     """
 
-def make_trend_chart(years, values, title, insight, color=COLORS["accent"],
+def show_chart(key, build, *args, **kwargs):
+    # The dashboard is read-only, so each figure is built once per session and
+    # reused from session state on later reruns. Builders return either
+    # to_dict() output Plotly already validated or, for the accreditation map,
+    # a hand-written raw dict that skips validation entirely. Wrapping them
+    # with _validate=False stops st.plotly_chart from validating either kind.
+    figs = st.session_state.setdefault("cached_figs", {})
+    if key not in figs:
+        figs[key] = go.Figure(build(*args, **kwargs), _validate=False)
+    st.plotly_chart(figs[key], use_container_width=True, config={"displayModeBar": False})
+
+# Shared figure styling merged into each layout. Streamlit rebuilds these
+# small dicts on every rerun; only the cached builders read them, on a miss.
+_BASE_LAYOUT = dict(
+    uirevision="static",
+    margin=dict(l=10, r=10, t=10, b=10),
+    plot_bgcolor="white",
+    paper_bgcolor="white",
+    hoverlabel=dict(bgcolor="white", font_size=12),
+)
+_BASE_XAXIS = dict(
+    showgrid=False, showline=True,
+    linecolor=COLORS.card_border,
+    tickfont=dict(size=10, color=COLORS.muted),
+)
+_BASE_YAXIS = dict(
+    showgrid=True, gridcolor="#F0F0F0",
+    showline=False,
+    tickfont=dict(size=10, color=COLORS.muted),
+)
+
+@st.cache_data(show_spinner=False)
+def make_trend_chart(years, values, title, insight, color=COLORS.accent,
                      suffix="", yrange=None, show_target=None):
     fig = go.Figure()
     fig.add_trace(go.Scatter(
@@ -271,84 +386,67 @@ def make_trend_chart(years, values, title, insight, color=COLORS["accent"],
     if show_target is not None:
         fig.add_hline(
             y=show_target, line_dash="dot",
-            line_color=COLORS["muted"],
+            line_color=COLORS.muted,
             annotation_text="Target",
             annotation_position="bottom right",
             annotation_font_size=10,
-            annotation_font_color=COLORS["muted"],
+            annotation_font_color=COLORS.muted,
         )
     fig.update_layout(
+        _BASE_LAYOUT,
         height=220,
-        margin=dict(l=10, r=10, t=10, b=10),
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        xaxis=dict(
-            showgrid=False, showline=True,
-            linecolor=COLORS["card_border"],
-            tickfont=dict(size=10, color=COLORS["muted"]),
-        ),
-        yaxis=dict(
-            showgrid=True, gridcolor="#F0F0F0",
-            showline=False,
-            tickfont=dict(size=10, color=COLORS["muted"]),
-            ticksuffix=suffix,
-            range=yrange,
-        ),
-        hoverlabel=dict(bgcolor="white", font_size=12),
+        xaxis=_BASE_XAXIS,
+        yaxis={**_BASE_YAXIS, "ticksuffix": suffix, "range": yrange},
     )
-    return fig
+    return fig.to_dict()
 
-def make_bar_chart(categories, values, title, color=COLORS["accent"],
-                   horizontal=False, suffix=""):
+@st.cache_data(show_spinner=False)
+def make_bar_chart(categories, values, title, color=COLORS.accent,
+                   horizontal=False, suffix="", text=None):
+    if text is None:
+        text = [f"{v}{suffix}" for v in values]
     if horizontal:
         fig = go.Figure(go.Bar(
             y=categories, x=values,
             orientation="h",
             marker_color=color,
-            text=[f"{v}{suffix}" for v in values],
+            text=text,
             textposition="outside",
             textfont=dict(size=10),
         ))
         fig.update_layout(
+            _BASE_LAYOUT,
             height=max(200, len(categories) * 35),
-            margin=dict(l=10, r=40, t=10, b=10),
+            margin=dict(r=40),
             xaxis=dict(showgrid=False, showticklabels=False, showline=False),
             yaxis=dict(showgrid=False, showline=False,
-                       tickfont=dict(size=10, color=COLORS["text"]),
+                       tickfont=dict(size=10, color=COLORS.text),
                        autorange="reversed"),
         )
     else:
         fig = go.Figure(go.Bar(
             x=categories, y=values,
             marker_color=color,
-            text=[f"{v}{suffix}" for v in values],
+            text=text,
             textposition="outside",
             textfont=dict(size=10),
         ))
         fig.update_layout(
+            _BASE_LAYOUT,
             height=220,
-            margin=dict(l=10, r=10, t=10, b=10),
-            yaxis=dict(showgrid=True, gridcolor="#F0F0F0", showline=False,
-                       tickfont=dict(size=10, color=COLORS["muted"])),
-            xaxis=dict(showgrid=False, showline=True,
-                       linecolor=COLORS["card_border"],
-                       tickfont=dict(size=10, color=COLORS["muted"])),
+            xaxis=_BASE_XAXIS,
+            yaxis=_BASE_YAXIS,
         )
-    fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        hoverlabel=dict(bgcolor="white", font_size=12),
-    )
-    return fig
+    return fig.to_dict()
 
-def make_gauge(value, max_val, label, color=COLORS["success"]):
+@st.cache_resource
+def _gauge_skeleton():
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
-        value=value,
-        number=dict(suffix="%", font=dict(size=28, color=COLORS["primary"])),
+        number=dict(suffix="%", font=dict(size=28, color=COLORS.primary)),
         gauge=dict(
-            axis=dict(range=[0, max_val], showticklabels=False),
-            bar=dict(color=color, thickness=0.6),
+            axis=dict(showticklabels=False),
+            bar=dict(thickness=0.6),
             bgcolor="#F0F0F0",
             borderwidth=0,
             shape="angular",
@@ -359,39 +457,153 @@ def make_gauge(value, max_val, label, color=COLORS["success"]):
         margin=dict(l=20, r=20, t=30, b=10),
         paper_bgcolor="white",
     )
-    return fig
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def make_gauge(value, max_val, label, color=COLORS.success):
+    # Only the indicator trace differs between gauges; the layout is shared
+    skeleton = _gauge_skeleton()
+    indicator = copy.deepcopy(skeleton["data"][0])
+    indicator["value"] = value
+    indicator["gauge"]["axis"]["range"] = [0, max_val]
+    indicator["gauge"]["bar"]["color"] = color
+    return {**skeleton, "data": [indicator]}
+
+@st.cache_data(show_spinner=False)
+def make_funding_chart(years, total, nih):
+    fig = go.Figure()
+    non_nih = (total - nih).tolist()
+    fig.add_trace(go.Bar(
+        x=years, y=nih.tolist(),
+        name="NIH", marker_color=COLORS.accent,
+    ))
+    fig.add_trace(go.Bar(
+        x=years, y=non_nih,
+        name="Other", marker_color=COLORS.warning,
+    ))
+    fig.update_layout(
+        _BASE_LAYOUT,
+        barmode="stack", height=240,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=10)),
+        xaxis=_BASE_XAXIS,
+        yaxis={**_BASE_YAXIS, "tickprefix": "$", "ticksuffix": "M"},
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def make_diversity_chart(years, pct_female, pct_urm):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=years, y=pct_female,
+        name="% Female", mode="lines+markers",
+        line=dict(color=COLORS.accent, width=2.5),
+        marker=dict(size=7),
+    ))
+    fig.add_trace(go.Scatter(
+        x=years, y=pct_urm,
+        name="% URM", mode="lines+markers",
+        line=dict(color=COLORS.warning, width=2.5),
+        marker=dict(size=7),
+    ))
+    fig.update_layout(
+        _BASE_LAYOUT,
+        height=220,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=10)),
+        xaxis=_BASE_XAXIS,
+        yaxis={**_BASE_YAXIS, "ticksuffix": "%", "range": [0, 50]},
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def make_dept_satisfaction_chart(depts, scores, colors, text):
+    fig = go.Figure(go.Bar(
+        y=depts, x=scores,
+        orientation="h",
+        marker_color=colors,
+        text=text,
+        textposition="outside",
+        textfont=dict(size=10),
+    ))
+    fig.update_layout(
+        _BASE_LAYOUT,
+        height=280,
+        margin=dict(r=40),
+        xaxis=dict(showgrid=False, showticklabels=False, showline=False, range=[0, 5]),
+        yaxis=dict(showgrid=False, showline=False,
+                   tickfont=dict(size=10, color=COLORS.text)),
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def make_accreditation_map():
+    # Raw figure dict: the trace and layout are fixed, so there is nothing
+    # for Plotly's validators to catch. cache_data hands every caller its own
+    # copy, since go.Figure() edits the dict it is given while wrapping it.
+    z_numeric, text = _build_accred_matrix()
+    return {
+        "data": [{
+            "type": "heatmap",
+            # Left as an int8 ndarray; Plotly encodes it as a compact i1 typed array
+            "z": z_numeric,
+            "x": [f"Std {i}" for i in range(1, 13)],
+            "y": [f"Elem {j}" for j in range(1, 9)],
+            "colorscale": [
+                [0, COLORS.danger],
+                [0.5, COLORS.warning],
+                [1.0, COLORS.success],
+            ],
+            "showscale": False,
+            "hovertemplate": "Standard %{x}, Element %{y}<br>Status: %{text}<extra></extra>",
+            "text": text.tolist(),
+        }],
+        "layout": {
+            "height": 250,
+            "margin": {"l": 10, "r": 10, "t": 10, "b": 10},
+            "plot_bgcolor": "white", "paper_bgcolor": "white",
+            "xaxis": {"tickfont": {"size": 9, "color": COLORS.muted}, "side": "top"},
+            "yaxis": {"tickfont": {"size": 9, "color": COLORS.muted}, "autorange": "reversed"},
+        },
+    }
 
 
 # ─────────────────────────────────────────────
 # LAYOUT
 # ─────────────────────────────────────────────
 
-# Header
-st.markdown(f"""
+# Header — only the "Updated" date varies between reruns
+_HEADER_HTML = """
 <div class="dashboard-header">
     <h1>Institutional Effectiveness Dashboard</h1>
-    <p>Academic Year 2024–25  ·  Synthetic demonstration data  ·  Updated {datetime.now().strftime('%B %d, %Y')}</p>
+    <p>Academic Year 2024–25  ·  Synthetic demonstration data  ·  Updated {updated}</p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_data(ttl=3600)
+def _today_str():
+    return datetime.now().strftime('%B %d, %Y')
+
+@st.cache_data(ttl=3600)
+def _current_year():
+    # Footer copyright year
+    return datetime.now().year
+
+st.markdown(_HEADER_HTML.format(updated=_today_str()), unsafe_allow_html=True)
 
 # ── TOP-LINE KPIs ──
-c1, c2, c3, c4, c5 = st.columns(5)
-with c1:
-    st.markdown(kpi_card("Total Enrollment", ed_data["enrollment"][-1],
-                         "+5 vs. prior year", "positive"), unsafe_allow_html=True)
-with c2:
-    st.markdown(kpi_card("Match Rate", f'{ed_data["match_rate"][-1]}',
-                         "−0.5pp vs. prior year", "negative", suffix="%"), unsafe_allow_html=True)
-with c3:
-    st.markdown(kpi_card("Research Funding", f'{res_data["total_funding_m"][-1]}',
-                         "+$7.4M vs. prior year", "positive", prefix="$", suffix="M"), unsafe_allow_html=True)
-with c4:
-    st.markdown(kpi_card("Faculty Count", wf_data["total_faculty"][-1],
-                         "+17 net new", "positive"), unsafe_allow_html=True)
-with c5:
-    st.markdown(kpi_card("LCME Standards Met",
-                         f'{comp_data["lcme_standards_met"]}/{comp_data["lcme_total_standards"]}',
-                         "2 newly met this cycle", "positive"), unsafe_allow_html=True)
+st.markdown(kpi_row(
+    kpi_card("Total Enrollment", f'{ed("enrollment")[-1]:.0f}',
+             ed_kpis["enrollment_delta_str"], ed_kpis["enrollment_delta_dir"]),
+    kpi_card("Match Rate", f'{ed("match_rate")[-1]}',
+             ed_kpis["match_rate_delta_str"], ed_kpis["match_rate_delta_dir"], suffix="%"),
+    kpi_card("Research Funding", f'{res_data["total_funding_m"][-1]}',
+             res_data["total_funding_delta_str"], res_data["total_funding_delta_dir"],
+             prefix="$", suffix="M"),
+    kpi_card("Faculty Count", wf_data["total_faculty"][-1],
+             wf_data["total_faculty_delta_str"], wf_data["total_faculty_delta_dir"]),
+    kpi_card("LCME Standards Met",
+             f'{comp_data["lcme_standards_met"]}/{comp_data["lcme_total_standards"]}',
+             "2 newly met this cycle", "positive"),
+), unsafe_allow_html=True)
 
 st.markdown("<div style='height: 0.5rem'></div>", unsafe_allow_html=True)
 
@@ -403,55 +615,48 @@ tab_ed, tab_res, tab_wf, tab_comp = st.tabs([
 # ════════════════════════════════════════════
 # EDUCATION TAB
 # ════════════════════════════════════════════
-with tab_ed:
+@st.fragment
+def _render_education_tab():
     st.markdown('<div class="section-header">Education Outcomes</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-caption">Decision focus: Are students succeeding, and where do we need to intervene?</div>', unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">USMLE Step 1 Pass Rate (%)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Consistently above national average. Stable performance suggests curriculum strength.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, ed_data["step1_pass"], "Step 1 Pass Rate",
-            "", color=COLORS["success"], suffix="%", yrange=[90, 100],
+        st.markdown(chart_card("USMLE Step 1 Pass Rate (%)",
+                               "Consistently above national average. Stable performance suggests curriculum strength."), unsafe_allow_html=True)
+        show_chart("step1_pass", make_trend_chart,
+            ACADEMIC_YEARS, ed("step1_pass"), "Step 1 Pass Rate",
+            "", color=COLORS.success, suffix="%", yrange=(90, 100),
             show_target=96.0
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        )
 
     with col2:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Residency Match Rate (%)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Recovered from 2021 dip. Watch whether top-choice rate sustains above 65%.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, ed_data["match_rate"], "Match Rate",
-            "", color=COLORS["accent"], suffix="%", yrange=[85, 100],
+        st.markdown(chart_card("Residency Match Rate (%)",
+                               "Recovered from 2021 dip. Watch whether top-choice rate sustains above 65%."), unsafe_allow_html=True)
+        show_chart("match_rate", make_trend_chart,
+            ACADEMIC_YEARS, ed("match_rate"), "Match Rate",
+            "", color=COLORS.accent, suffix="%", yrange=(85, 100),
             show_target=94.0
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        )
 
     col3, col4 = st.columns(2)
     with col3:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Student Satisfaction (MSQ Overall, 1–5 Scale)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Steady climb since COVID low in 2020–21. Approaching 4.0 threshold for first time.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, ed_data["msq_overall_satisfaction"], "MSQ Satisfaction",
-            "", color=COLORS["warning"], suffix="", yrange=[3.0, 4.5],
+        st.markdown(chart_card("Student Satisfaction (MSQ Overall, 1–5 Scale)",
+                               "Steady climb since COVID low in 2020–21. Approaching 4.0 threshold for first time."), unsafe_allow_html=True)
+        show_chart("msq_satisfaction", make_trend_chart,
+            ACADEMIC_YEARS, ed("msq_overall_satisfaction"), "MSQ Satisfaction",
+            "", color=COLORS.warning, suffix="", yrange=(3.0, 4.5),
             show_target=4.0
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        )
 
     with col4:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Attrition Rate (%)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Below 2.5% for two consecutive years. Retention initiatives are working.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, ed_data["attrition_rate"], "Attrition",
-            "", color=COLORS["danger"], suffix="%", yrange=[0, 5],
+        st.markdown(chart_card("Attrition Rate (%)",
+                               "Below 2.5% for two consecutive years. Retention initiatives are working."), unsafe_allow_html=True)
+        show_chart("attrition", make_trend_chart,
+            ACADEMIC_YEARS, ed("attrition_rate"), "Attrition",
+            "", color=COLORS.danger, suffix="%", yrange=(0, 5),
             show_target=2.5
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        )
 
     st.markdown("""
     <div class="narrative-box">
@@ -461,73 +666,49 @@ with tab_ed:
     </div>
     """, unsafe_allow_html=True)
 
+with tab_ed:
+    _render_education_tab()
+
 # ════════════════════════════════════════════
 # RESEARCH TAB
 # ════════════════════════════════════════════
-with tab_res:
+@st.fragment
+def _render_research_tab():
     st.markdown('<div class="section-header">Research Enterprise</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-caption">Decision focus: Is research funding growing, and are we diversifying revenue?</div>', unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Total Research Funding ($M)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">30% growth over 6 years. NIH share remains ~67%, suggesting healthy but concentrated portfolio.</div>', unsafe_allow_html=True)
-
-        fig = go.Figure()
-        non_nih = [t - n for t, n in zip(res_data["total_funding_m"], res_data["nih_funding_m"])]
-        fig.add_trace(go.Bar(
-            x=ACADEMIC_YEARS, y=res_data["nih_funding_m"],
-            name="NIH", marker_color=COLORS["accent"],
-        ))
-        fig.add_trace(go.Bar(
-            x=ACADEMIC_YEARS, y=non_nih,
-            name="Other", marker_color=COLORS["warning"],
-        ))
-        fig.update_layout(
-            barmode="stack", height=240,
-            margin=dict(l=10, r=10, t=10, b=10),
-            plot_bgcolor="white", paper_bgcolor="white",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=10)),
-            xaxis=dict(showgrid=False, showline=True, linecolor=COLORS["card_border"],
-                       tickfont=dict(size=10, color=COLORS["muted"])),
-            yaxis=dict(showgrid=True, gridcolor="#F0F0F0", showline=False,
-                       tickfont=dict(size=10, color=COLORS["muted"]), tickprefix="$", ticksuffix="M"),
-            hoverlabel=dict(bgcolor="white", font_size=12),
+        st.markdown(chart_card("Total Research Funding ($M)",
+                               "30% growth over 6 years. NIH share remains ~67%, suggesting healthy but concentrated portfolio."), unsafe_allow_html=True)
+        show_chart("funding", make_funding_chart,
+            ACADEMIC_YEARS, res_data["total_funding_m"], res_data["nih_funding_m"]
         )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
 
     with col2:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Faculty Publications (Peer-Reviewed)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Consistent upward trend. 33% increase since 2019–20 reflects hiring and productivity gains.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, res_data["faculty_pubs"], "Publications",
-            "", color=COLORS["primary"], suffix=""
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(chart_card("Faculty Publications (Peer-Reviewed)",
+                               "Consistent upward trend. 33% increase since 2019–20 reflects hiring and productivity gains."), unsafe_allow_html=True)
+        show_chart("faculty_pubs", make_trend_chart,
+            ACADEMIC_YEARS, tuple(res_data["faculty_pubs"]), "Publications",
+            "", color=COLORS.primary, suffix=""
+        )
 
     col3, col4 = st.columns(2)
     with col3:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Active Clinical Trials</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">38% growth signals expanding clinical research enterprise and industry partnerships.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, res_data["clinical_trials"], "Clinical Trials",
-            "", color=COLORS["success"], suffix=""
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(chart_card("Active Clinical Trials",
+                               "38% growth signals expanding clinical research enterprise and industry partnerships."), unsafe_allow_html=True)
+        show_chart("clinical_trials", make_trend_chart,
+            ACADEMIC_YEARS, tuple(res_data["clinical_trials"]), "Clinical Trials",
+            "", color=COLORS.success, suffix=""
+        )
 
     with col4:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Median Faculty h-index</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Steady improvement. Crossing 20 is a meaningful benchmark for research-intensive schools.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, res_data["h_index_median"], "h-index",
-            "", color=COLORS["accent"], suffix="", yrange=[15, 25]
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(chart_card("Median Faculty h-index",
+                               "Steady improvement. Crossing 20 is a meaningful benchmark for research-intensive schools."), unsafe_allow_html=True)
+        show_chart("h_index", make_trend_chart,
+            ACADEMIC_YEARS, tuple(res_data["h_index_median"]), "h-index",
+            "", color=COLORS.accent, suffix="", yrange=(15, 25)
+        )
 
     st.markdown("""
     <div class="narrative-box">
@@ -538,101 +719,52 @@ with tab_res:
     </div>
     """, unsafe_allow_html=True)
 
+with tab_res:
+    _render_research_tab()
+
 # ════════════════════════════════════════════
 # WORKFORCE TAB
 # ════════════════════════════════════════════
-with tab_wf:
+@st.fragment
+def _render_workforce_tab():
     st.markdown('<div class="section-header">Faculty & Workforce</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-caption">Decision focus: Are we building a diverse, stable, and productive workforce?</div>', unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Faculty Diversity Trends</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Both female and URM representation are rising, but URM pace needs to accelerate to meet strategic goals.</div>', unsafe_allow_html=True)
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=ACADEMIC_YEARS, y=wf_data["pct_female_faculty"],
-            name="% Female", mode="lines+markers",
-            line=dict(color=COLORS["accent"], width=2.5),
-            marker=dict(size=7),
-        ))
-        fig.add_trace(go.Scatter(
-            x=ACADEMIC_YEARS, y=wf_data["pct_urm_faculty"],
-            name="% URM", mode="lines+markers",
-            line=dict(color=COLORS["warning"], width=2.5),
-            marker=dict(size=7),
-        ))
-        fig.update_layout(
-            height=220,
-            margin=dict(l=10, r=10, t=10, b=10),
-            plot_bgcolor="white", paper_bgcolor="white",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=10)),
-            xaxis=dict(showgrid=False, showline=True, linecolor=COLORS["card_border"],
-                       tickfont=dict(size=10, color=COLORS["muted"])),
-            yaxis=dict(showgrid=True, gridcolor="#F0F0F0", showline=False,
-                       tickfont=dict(size=10, color=COLORS["muted"]), ticksuffix="%",
-                       range=[0, 50]),
-            hoverlabel=dict(bgcolor="white", font_size=12),
+        st.markdown(chart_card("Faculty Diversity Trends",
+                               "Both female and URM representation are rising, but URM pace needs to accelerate to meet strategic goals."), unsafe_allow_html=True)
+        show_chart("diversity", make_diversity_chart,
+            ACADEMIC_YEARS, tuple(wf_data["pct_female_faculty"]),
+            tuple(wf_data["pct_urm_faculty"])
         )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
 
     with col2:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Voluntary Turnover Rate (%)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Below 7.5% and declining. Retention strategies and mentorship investment are paying off.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, wf_data["voluntary_turnover"], "Turnover",
-            "", color=COLORS["danger"], suffix="%", yrange=[4, 12],
+        st.markdown(chart_card("Voluntary Turnover Rate (%)",
+                               "Below 7.5% and declining. Retention strategies and mentorship investment are paying off."), unsafe_allow_html=True)
+        show_chart("turnover", make_trend_chart,
+            ACADEMIC_YEARS, tuple(wf_data["voluntary_turnover"]), "Turnover",
+            "", color=COLORS.danger, suffix="%", yrange=(4, 12),
             show_target=7.5
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        )
 
     col3, col4 = st.columns(2)
     with col3:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Median Time to Promotion (Years)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Trending below 6 years for the first time. Streamlined review processes are accelerating career progression.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_trend_chart(
-            ACADEMIC_YEARS, wf_data["time_to_promotion_yr"], "Years",
-            "", color=COLORS["primary"], suffix=" yr", yrange=[4, 8],
+        st.markdown(chart_card("Median Time to Promotion (Years)",
+                               "Trending below 6 years for the first time. Streamlined review processes are accelerating career progression."), unsafe_allow_html=True)
+        show_chart("promotion", make_trend_chart,
+            ACADEMIC_YEARS, tuple(wf_data["time_to_promotion_yr"]), "Years",
+            "", color=COLORS.primary, suffix=" yr", yrange=(4, 8),
             show_target=6.0
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        )
 
     with col4:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Department Satisfaction Scores (1–5)</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">Most departments above 3.5. Identify low-scoring departments for targeted leadership development.</div>', unsafe_allow_html=True)
-        depts = list(wf_data["dept_satisfaction"].keys())
-        scores = list(wf_data["dept_satisfaction"].values())
-        # Sort by score
-        sorted_pairs = sorted(zip(depts, scores), key=lambda x: x[1])
-        depts_sorted = [p[0] for p in sorted_pairs]
-        scores_sorted = [p[1] for p in sorted_pairs]
-        colors_bar = [COLORS["danger"] if s < 3.5 else COLORS["accent"] for s in scores_sorted]
-
-        fig = go.Figure(go.Bar(
-            y=depts_sorted, x=scores_sorted,
-            orientation="h",
-            marker_color=colors_bar,
-            text=[f"{v:.1f}" for v in scores_sorted],
-            textposition="outside",
-            textfont=dict(size=10),
-        ))
-        fig.update_layout(
-            height=280,
-            margin=dict(l=10, r=40, t=10, b=10),
-            plot_bgcolor="white", paper_bgcolor="white",
-            xaxis=dict(showgrid=False, showticklabels=False, showline=False, range=[0, 5]),
-            yaxis=dict(showgrid=False, showline=False,
-                       tickfont=dict(size=10, color=COLORS["text"])),
-            hoverlabel=dict(bgcolor="white", font_size=12),
+        st.markdown(chart_card("Department Satisfaction Scores (1–5)",
+                               "Most departments above 3.5. Identify low-scoring departments for targeted leadership development."), unsafe_allow_html=True)
+        show_chart("dept_satisfaction", make_dept_satisfaction_chart,
+            wf_data["depts_sorted"], wf_data["scores_sorted"], wf_data["dept_colors"],
+            wf_data["dept_labels"]
         )
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
 
     st.markdown("""
     <div class="narrative-box">
@@ -643,120 +775,74 @@ with tab_wf:
     </div>
     """, unsafe_allow_html=True)
 
+with tab_wf:
+    _render_workforce_tab()
+
 # ════════════════════════════════════════════
 # COMPLIANCE TAB
 # ════════════════════════════════════════════
-with tab_comp:
+_ACCRED_NARRATIVE = """
+<div class="narrative-box">
+    <strong>What this means:</strong> Accreditation posture is strong with 97.9% of standards met. The 4 open
+    action items are tracked and assigned. Priority before the 2028 visit: close the 2 "needs attention"
+    standards (likely curriculum mapping completeness and assessment documentation) and achieve 98%
+    compliance training completion by June.
+</div>
+"""
+
+@st.fragment
+def _render_compliance_tab():
     st.markdown('<div class="section-header">Accreditation & Compliance</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-caption">Decision focus: Are we ready for the next LCME visit, and where are the gaps?</div>', unsafe_allow_html=True)
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(kpi_card("Accreditation Status", "Full",
-                             "Next visit: 2028", "positive"), unsafe_allow_html=True)
-    with col2:
-        st.markdown(kpi_card("Standards Met",
-                             f'{comp_data["lcme_standards_met"]} of {comp_data["lcme_total_standards"]}',
-                             "97.9% compliance", "positive"), unsafe_allow_html=True)
-    with col3:
-        st.markdown(kpi_card("Open Action Items", comp_data["open_action_items"],
-                             "Down from 7 last year", "positive"), unsafe_allow_html=True)
+    st.markdown(kpi_row(
+        kpi_card("Accreditation Status", "Full",
+                 "Next visit: 2028", "positive"),
+        kpi_card("Standards Met",
+                 f'{comp_data["lcme_standards_met"]} of {comp_data["lcme_total_standards"]}',
+                 "97.9% compliance", "positive"),
+        kpi_card("Open Action Items", comp_data["open_action_items"],
+                 "Down from 7 last year", "positive"),
+    ), unsafe_allow_html=True)
 
     st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
 
     col4, col5, col6 = st.columns(3)
     with col4:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">ISA Completion</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">On track for full completion before visit.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_gauge(comp_data["isa_completion"], 100, "ISA", COLORS["success"]),
-                        use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(chart_card("ISA Completion",
+                               "On track for full completion before visit."), unsafe_allow_html=True)
+        show_chart("isa_gauge", make_gauge, comp_data["isa_completion"], 100, "ISA", COLORS.success)
 
     with col5:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">CQI Projects</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">12 active, 8 completed this cycle.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_gauge(
+        st.markdown(chart_card("CQI Projects",
+                               "12 active, 8 completed this cycle."), unsafe_allow_html=True)
+        show_chart("cqi_gauge", make_gauge,
             comp_data["cqi_projects_complete"] / (comp_data["cqi_projects_active"] + comp_data["cqi_projects_complete"]) * 100,
-            100, "CQI", COLORS["accent"]
-        ), use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+            100, "CQI", COLORS.accent
+        )
 
     with col6:
-        st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-        st.markdown('<div class="chart-title">Compliance Training</div>', unsafe_allow_html=True)
-        st.markdown('<div class="chart-insight">94.8% complete. Target: 98% by June.</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_gauge(comp_data["compliance_training_pct"], 100, "Training", COLORS["warning"]),
-                        use_container_width=True, config={"displayModeBar": False})
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(chart_card("Compliance Training",
+                               "94.8% complete. Target: 98% by June."), unsafe_allow_html=True)
+        show_chart("training_gauge", make_gauge, comp_data["compliance_training_pct"], 100, "Training", COLORS.warning)
 
     # LCME Standards Heatmap
     st.markdown("<div style='height: 0.5rem'></div>", unsafe_allow_html=True)
-    st.markdown('<div class="chart-card">', unsafe_allow_html=True)
-    st.markdown('<div class="chart-title">LCME Standards Compliance Map</div>', unsafe_allow_html=True)
-    st.markdown('<div class="chart-insight">Green = met, gold = in progress, red = needs attention. Two standards require action before 2028 visit.</div>', unsafe_allow_html=True)
-
-    np.random.seed(99)
-    standards = []
-    for i in range(1, 13):
-        for j in range(1, 9):
-            sid = f"{i}.{j}"
-            r = np.random.random()
-            if r < 0.03:
-                status = "Needs Attention"
-                color = COLORS["danger"]
-            elif r < 0.08:
-                status = "In Progress"
-                color = COLORS["warning"]
-            else:
-                status = "Met"
-                color = COLORS["success"]
-            standards.append({"element": i, "sub": j, "status": status, "color": color, "id": sid})
-
-    df_standards = pd.DataFrame(standards)
-    pivot = df_standards.pivot(index="sub", columns="element", values="status")
-
-    color_map = {"Met": COLORS["success"], "In Progress": COLORS["warning"], "Needs Attention": COLORS["danger"]}
-    z_numeric = pivot.map(lambda x: 2 if x == "Met" else 1 if x == "In Progress" else 0)
-
-    fig = go.Figure(go.Heatmap(
-        z=z_numeric.values,
-        x=[f"Std {i}" for i in range(1, 13)],
-        y=[f"Elem {j}" for j in range(1, 9)],
-        colorscale=[
-            [0, COLORS["danger"]],
-            [0.5, COLORS["warning"]],
-            [1.0, COLORS["success"]],
-        ],
-        showscale=False,
-        hovertemplate="Standard %{x}, Element %{y}<br>Status: %{text}<extra></extra>",
-        text=pivot.values,
-    ))
-    fig.update_layout(
-        height=250,
-        margin=dict(l=10, r=10, t=10, b=10),
-        plot_bgcolor="white", paper_bgcolor="white",
-        xaxis=dict(tickfont=dict(size=9, color=COLORS["muted"]), side="top"),
-        yaxis=dict(tickfont=dict(size=9, color=COLORS["muted"]), autorange="reversed"),
-    )
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(chart_card("LCME Standards Compliance Map",
+                           "Green = met, gold = in progress, red = needs attention. Two standards require action before 2028 visit."), unsafe_allow_html=True)
+    show_chart("lcme_map", make_accreditation_map)
 
-    st.markdown("""
-    <div class="narrative-box">
-        <strong>What this means:</strong> Accreditation posture is strong with 97.9% of standards met. The 4 open
-        action items are tracked and assigned. Priority before the 2028 visit: close the 2 "needs attention"
-        standards (likely curriculum mapping completeness and assessment documentation) and achieve 98%
-        compliance training completion by June.
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ACCRED_NARRATIVE, unsafe_allow_html=True)
+
+with tab_comp:
+    _render_compliance_tab()
 
 
 # ── FOOTER ──
-st.markdown(f"""
+_FOOTER_HTML = """
 <div class="dashboard-footer">
     Enterprise Institutional Effectiveness Dashboard  ·  Demonstration with synthetic data<br>
-    Built by Per Ram Paragi  ·  Director, Accreditation & Strategic Planning  ·  {datetime.now().year}
+    Built by Per Ram Paragi  ·  Director, Accreditation & Strategic Planning  ·  {year}
 </div>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_FOOTER_HTML.format(year=_current_year()), unsafe_allow_html=True)